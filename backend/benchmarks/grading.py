@@ -0,0 +1,206 @@
+"""Offline grading benchmark: replay a fixture corpus through grade_answer_with_ai.
+
+Sources:
+  recorded  replay the raw responses stored with each fixture case (default)
+  stub      deterministic local stand-in that scores by answer length/structure
+  live      call make_llm_request as configured (needs AMPLIFY_API_KEY, or a
+            cassette via LLM_CASSETTE_MODE=strict)
+
+Reports parse success rate, in-band rate, per-case score variance across
+repeats, latency percentiles and estimated tokens per grade as JSON. In strict
+cassette mode a miss counts as a failed grade and is tallied separately.
+
+Latency is split in two: parse_overhead_ms is the time spent in
+grade_answer_with_ai outside the LLM call (prompt build and response parsing),
+and request_latency_ms is the LLM call itself. Recorded and stub responses
+return instantly, so request_latency_ms is only reported for --source live.
+
+    python -m benchmarks.grading --repeats 5 --output bench_grading.json
+"""
+import argparse
+import contextlib
+import json
+import math
+import os
+import random
+import statistics
+import sys
+import time
+
+from dotenv import load_dotenv
+
+import llm
+from cassette import CassetteMissError
+
+FIXTURES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "grading_cases.json")
+
+# The Amplify API doesn't report usage, so tokens are estimated from characters
+CHARS_PER_TOKEN = 4
+
+
+def load_cases(path=FIXTURES_PATH):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)["cases"]
+
+
+def recorded_responder(case, repeat):
+    responses = case["recorded"]
+    return lambda messages: responses[repeat % len(responses)]
+
+
+def stub_responder(case, repeat, seed=0):
+    """Local stand-in: longer answers with numbers score higher, plus +/-1 jitter."""
+    rng = random.Random(f"{seed}:{case['id']}:{repeat}")
+    answer = case["answer"]
+    score = min(10, len(answer.split()) // 8)
+    if any(ch.isdigit() for ch in answer):
+        score += 2
+    score = max(0, min(10, score + rng.choice([-1, 0, 1])))
+    return lambda messages: f"SCORE: {score}\nFEEDBACK: Stand-in evaluation."
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    # Nearest-rank method
+    index = min(len(ordered) - 1, max(0, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def run_case(case, repeats, source, seed):
+    original = llm.make_llm_request
+    results = []
+    for repeat in range(repeats):
+        if source == "recorded":
+            responder = recorded_responder(case, repeat)
+        elif source == "stub":
+            responder = stub_responder(case, repeat, seed)
+        else:
+            responder = original
+
+        exchange = {}
+
+        def capture(messages):
+            exchange["prompt"] = messages[0]["content"]
+            request_start = time.perf_counter()
+            try:
+                exchange["response"] = responder(messages)
+            except CassetteMissError:
+                # grade_answer_with_ai turns this into a failed grade
+                exchange["miss"] = True
+                raise
+            finally:
+                exchange["request_ms"] = (time.perf_counter() - request_start) * 1000
+            return exchange["response"]
+
+        llm.make_llm_request = capture
+        try:
+            start = time.perf_counter()
+            score, _ = llm.grade_answer_with_ai(
+                case["question"], case["answer"], case["role"], case["difficulty"]
+            )
+            elapsed_ms = (time.perf_counter() - start) * 1000
+        finally:
+            llm.make_llm_request = original
+
+        chars = len(exchange.get("prompt", "")) + len(exchange.get("response") or "")
+        request_ms = exchange.get("request_ms", 0.0)
+        results.append({
+            "score": score,
+            "cassette_miss": exchange.get("miss", False),
+            "request_ms": request_ms,
+            "overhead_ms": elapsed_ms - request_ms,
+            "tokens": chars / CHARS_PER_TOKEN,
+        })
+    return results
+
+
+def summarize_case(case, results):
+    scores = [r["score"] for r in results if r["score"] is not None]
+    low, high = case["expected_band"]
+    return {
+        "id": case["id"],
+        "expected_band": [low, high],
+        "scores": [r["score"] for r in results],
+        "parse_success_rate": len(scores) / len(results),
+        "in_band_rate": sum(low <= s <= high for s in scores) / len(results),
+        "score_variance": statistics.pvariance(scores) if scores else None,
+    }
+
+
+def latency_summary(values):
+    return {
+        "p50": round(percentile(values, 50), 3),
+        "p90": round(percentile(values, 90), 3),
+        "p99": round(percentile(values, 99), 3),
+    }
+
+
+def run(cases, repeats=3, source="recorded", seed=0):
+    if not cases or repeats < 1:
+        raise ValueError("Need at least one fixture case and one repeat")
+
+    per_case = []
+    all_results = []
+    for case in cases:
+        results = run_case(case, repeats, source, seed)
+        all_results.extend(results)
+        per_case.append(summarize_case(case, results))
+
+    overheads = [r["overhead_ms"] for r in all_results]
+    request_latencies = [r["request_ms"] for r in all_results]
+    tokens = [r["tokens"] for r in all_results]
+    variances = [c["score_variance"] for c in per_case if c["score_variance"] is not None]
+    parsed = sum(r["score"] is not None for r in all_results)
+
+    return {
+        "source": source,
+        "cases": len(cases),
+        "repeats": repeats,
+        "grades": len(all_results),
+        "parse_success_rate": round(parsed / len(all_results), 4),
+        "cassette_misses": sum(r["cassette_miss"] for r in all_results),
+        "in_band_rate": round(statistics.mean(c["in_band_rate"] for c in per_case), 4),
+        "score_variance": {
+            "mean": round(statistics.mean(variances), 4) if variances else None,
+            "max": round(max(variances), 4) if variances else None,
+        },
+        "parse_overhead_ms": latency_summary(overheads),
+        "request_latency_ms": latency_summary(request_latencies) if source == "live" else None,
+        "tokens_per_grade": round(statistics.mean(tokens), 1),
+        "per_case": per_case,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--source", choices=["recorded", "stub", "live"], default="recorded")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0, help="seed for the stub source")
+    parser.add_argument("--fixtures", default=FIXTURES_PATH)
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    if args.source == "live":
+        load_dotenv()
+
+    if args.repeats < 1:
+        parser.error("--repeats must be at least 1")
+    cases = load_cases(args.fixtures)
+    if not cases:
+        parser.error(f"no cases in {args.fixtures}")
+
+    # llm prints its diagnostics; keep them out of the JSON on stdout
+    with contextlib.redirect_stdout(sys.stderr):
+        report = run(cases, args.repeats, args.source, args.seed)
+    report["timestamp"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""Measure cold-start latency: process start -> import -> create_app -> first request.
+
+Each run happens in a fresh interpreter so imports aren't cached.
+
+    python -m benchmarks.startup --runs 10 --json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs inside the child interpreter; prints timings in milliseconds as JSON
+_PROBE = """
+import json, time
+t0 = time.perf_counter()
+from app import create_app
+t1 = time.perf_counter()
+app = create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite://', 'TESTING': True})
+t2 = time.perf_counter()
+response = app.test_client().get('/api/roles')
+t3 = time.perf_counter()
+assert response.status_code == 200
+print(json.dumps({
+    'import_ms': (t1 - t0) * 1000,
+    'create_app_ms': (t2 - t1) * 1000,
+    'first_request_ms': (t3 - t2) * 1000,
+    'total_ms': (t3 - t0) * 1000,
+}))
+"""
+
+
+def run_once():
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def summarize(samples):
+    summary = {}
+    for key in samples[0]:
+        values = sorted(sample[key] for sample in samples)
+        summary[key] = {
+            "min": round(values[0], 2),
+            "median": round(statistics.median(values), 2),
+            "max": round(values[-1], 2),
+        }
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="print machine-readable output")
+    args = parser.parse_args()
+
+    samples = [run_once() for _ in range(args.runs)]
+    summary = summarize(samples)
+
+    if args.json:
+        print(json.dumps({"runs": args.runs, "summary": summary}, indent=2))
+        return
+
+    print(f"Startup latency over {args.runs} runs (ms)")
+    for key, stats in summary.items():
+        print(f"  {key:<18} min {stats['min']:>8}  median {stats['median']:>8}  max {stats['max']:>8}")
+
+
+if __name__ == '__main__':
+    main()
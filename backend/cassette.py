@@ -0,0 +1,193 @@
+"""Record/replay store for LLM request/response pairs.
+
+Selected with LLM_CASSETTE_MODE:
+  off     (default) always call the API
+  record  call the API and append every response to the cassette
+  replay  serve stored responses; on a miss call the API and record it
+  strict  serve stored responses; a miss raises CassetteMissError
+
+LLM_CASSETTE_PATH sets the file (default cassettes/llm.cassette).
+
+File format: an 8-byte magic header followed by append-only records of
+  b"REC1" | sha256(request) [32 bytes] | request length [4]
+  | response length [4] | crc32(digest + body) [4] | zlib(request JSON) | zlib(response text)
+The file is memory-mapped and indexed by digest on first use; records appended
+by other processes are picked up on the next miss. A torn or corrupt record
+(bad marker, length or checksum) is logged and skipped; the scan resumes at the
+next valid record, so entries on either side of the damage stay readable.
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import zlib
+
+MODES = ("off", "record", "replay", "strict")
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cassettes", "llm.cassette")
+
+MAGIC = b"HRPGCAS2"
+RECORD_MARKER = b"REC1"
+_HEADER = struct.Struct(">4s32sIII")
+# Far above any real prompt/response; larger lengths mean a corrupt header
+MAX_BODY_BYTES = 64 * 1024 * 1024
+
+
+class CassetteMissError(LookupError):
+    """Raised in strict mode when a request has no recorded response."""
+
+
+def request_key(payload):
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).digest()
+
+
+class Cassette:
+    def __init__(self, path, mode):
+        if mode not in MODES:
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.path = path
+        self.mode = mode
+        self._index = {}
+        self._map = None
+        self._scanned = 0
+        self._lock = threading.Lock()
+
+    def _refresh(self):
+        """Map the file and index any records added since the last scan."""
+        if not os.path.exists(self.path):
+            return
+        size = os.path.getsize(self.path)
+        if size <= self._scanned:
+            return
+
+        if self._map is not None:
+            self._map.close()
+        with open(self.path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._scanned == 0:
+            if self._map[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"{self.path} is not a cassette file")
+            self._scanned = len(MAGIC)
+
+        offset = self._scanned
+        while offset + _HEADER.size <= size:
+            record = self._parse(offset, size)
+            if record is None:
+                # Either still being written, or torn by a crashed writer. Only
+                # skip it once a valid record shows up after it.
+                resume = self._next_valid(offset, size)
+                if resume is None:
+                    break
+                print(f"Warning: {self.path}: skipping damaged record at offset {offset}")
+                offset = resume
+                continue
+            digest, value_start, resp_len, end = record
+            self._index[digest] = (value_start, resp_len)
+            offset = end
+        self._scanned = offset
+
+    def _parse(self, offset, size):
+        """Return (digest, response offset, response length, end) for a complete,
+        valid record at `offset`, or None."""
+        if offset + _HEADER.size > size:
+            return None
+        marker, digest, req_len, resp_len, crc = _HEADER.unpack_from(self._map, offset)
+        if marker != RECORD_MARKER or req_len + resp_len > MAX_BODY_BYTES:
+            return None
+        body_start = offset + _HEADER.size
+        end = body_start + req_len + resp_len
+        if end > size:
+            return None
+        if zlib.crc32(self._map[body_start:end], zlib.crc32(digest)) != crc:
+            return None
+        return digest, body_start + req_len, resp_len, end
+
+    def _next_valid(self, offset, size):
+        """Offset of the first valid record after `offset`, or None."""
+        position = self._map.find(RECORD_MARKER, offset + 1, size)
+        while position != -1:
+            if self._parse(position, size) is not None:
+                return position
+            position = self._map.find(RECORD_MARKER, position + 1, size)
+        return None
+
+    def lookup(self, payload):
+        key = request_key(payload)
+        with self._lock:
+            if key not in self._index:
+                self._refresh()
+            entry = self._index.get(key)
+            if entry is None:
+                return None
+            start, length = entry
+            return zlib.decompress(self._map[start:start + length]).decode("utf-8")
+
+    def _create_file(self):
+        """Create the file with its header atomically, unless it already exists."""
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        if os.path.exists(self.path):
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=directory)
+        try:
+            os.write(fd, MAGIC)
+            os.close(fd)
+            # mkstemp creates 0600; cassettes are shared between CI and demo hosts
+            os.chmod(tmp_path, 0o644)
+            # link() fails if another process created the file first
+            os.link(tmp_path, self.path)
+        except FileExistsError:
+            pass
+        finally:
+            os.unlink(tmp_path)
+
+    def record(self, payload, response):
+        key = request_key(payload)
+        request_blob = zlib.compress(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+        response_blob = zlib.compress(response.encode("utf-8"))
+        body = request_blob + response_blob
+        record = _HEADER.pack(
+            RECORD_MARKER, key, len(request_blob), len(response_blob),
+            zlib.crc32(body, zlib.crc32(key))
+        ) + body
+
+        with self._lock:
+            self._create_file()
+            # Single O_APPEND write so concurrent writers don't interleave records
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND)
+            try:
+                written = os.write(fd, record)
+            finally:
+                os.close(fd)
+            if written != len(record):
+                raise OSError(f"{self.path}: short write ({written} of {len(record)} bytes)")
+
+    def close(self):
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            self._index = {}
+            self._scanned = 0
+
+
+_cassette = None
+
+
+def get_cassette():
+    """Return the configured cassette, or None when the mode is off."""
+    global _cassette
+    mode = os.getenv("LLM_CASSETTE_MODE", "off").lower()
+    if mode == "off":
+        return None
+    path = os.getenv("LLM_CASSETTE_PATH", DEFAULT_PATH)
+    if _cassette is None or _cassette.mode != mode or _cassette.path != path:
+        if _cassette is not None:
+            _cassette.close()
+        _cassette = Cassette(path, mode)
+    return _cassette
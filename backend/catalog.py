@@ -0,0 +1,143 @@
+import hashlib
+import json
+import os
+from string import Template
+
+# Role catalog config, loaded once at startup. Add roles or difficulty levels
+# by editing the JSON file; no code changes needed.
+CATALOG_PATH = os.getenv(
+    "ROLE_CATALOG_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "config", "roles.json")
+)
+
+QUESTION_PROMPT = """You are an expert interviewer for $description.
+
+Generate a behavioral interview question for a candidate. This is question $question_number of the interview.
+
+Role: $name
+Difficulty: $difficulty
+
+Requirements:
+- The question should be appropriate for the $difficulty difficulty level
+$question_guidance
+
+Respond with ONLY the interview question, nothing else. Do not include any preamble or explanation."""
+
+GRADING_PROMPT = """You are an expert interviewer evaluating a candidate's response for $description.
+
+Interview Question: $question
+
+Candidate's Answer: $answer
+
+Role: $name
+Difficulty Level: $difficulty
+
+Please evaluate this answer and provide a score from 0 to 10 based on:
+- Relevance to the question (25 points)
+- Depth and specificity of the response (25 points)
+- Use of concrete examples (25 points)
+- Communication clarity and structure (25 points)
+
+For $difficulty difficulty:
+$grading_guidance
+
+IMPORTANT: You must respond in this EXACT format:
+SCORE: [number]
+FEEDBACK: [your feedback in 1-2 sentences]
+
+Example response:
+SCORE: 7
+FEEDBACK: Good use of the STAR method with a relevant example, but could have elaborated more on the specific impact of your actions."""
+
+
+def _escape(value):
+    # Keep literal '$' in config values from being read as placeholders
+    return str(value).replace("$", "$$")
+
+
+def _compile(template, role_info, difficulty):
+    """Fill in the static role/difficulty fields, leaving per-call fields open."""
+    text = Template(template).safe_substitute(
+        description=_escape(role_info["description"]),
+        name=_escape(role_info["name"]),
+        difficulty=_escape(difficulty),
+        question_guidance=_escape(QUESTION_GUIDANCE),
+        grading_guidance=_escape(GRADING_GUIDANCE),
+    )
+    return Template(text)
+
+
+def load_catalog(path=CATALOG_PATH):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+_catalog = load_catalog()
+
+DEFAULT_ROLE = _catalog["default_role"]
+
+# Role display names and difficulty descriptions
+ROLE_INFO = {
+    role["id"]: {
+        "name": role["name"],
+        "difficulty": role["difficulty"],
+        "description": role["description"],
+    }
+    for role in _catalog["roles"]
+}
+
+DIFFICULTY_INFO = {level["name"]: level for level in _catalog["difficulties"]}
+
+QUESTION_GUIDANCE = "\n".join(
+    f'- For "{name}" difficulty: {level["question"]}'
+    for name, level in DIFFICULTY_INFO.items()
+)
+
+GRADING_GUIDANCE = "\n".join(
+    f'- {name}: {level["grading"]}'
+    for name, level in DIFFICULTY_INFO.items()
+)
+
+# Precompiled prompt templates keyed by (role, difficulty)
+QUESTION_TEMPLATES = {
+    (role, difficulty): _compile(QUESTION_PROMPT, info, difficulty)
+    for role, info in ROLE_INFO.items()
+    for difficulty in DIFFICULTY_INFO
+}
+
+GRADING_TEMPLATES = {
+    (role, difficulty): _compile(GRADING_PROMPT, info, difficulty)
+    for role, info in ROLE_INFO.items()
+    for difficulty in DIFFICULTY_INFO
+}
+
+# Serialized /api/roles payload and its ETag
+ROLES_PAYLOAD = json.dumps([
+    {"id": role, "name": info["name"], "difficulty": info["difficulty"]}
+    for role, info in ROLE_INFO.items()
+]).encode("utf-8")
+ROLES_ETAG = hashlib.sha1(ROLES_PAYLOAD).hexdigest()
+
+
+def get_role_info(role):
+    return ROLE_INFO.get(role, ROLE_INFO[DEFAULT_ROLE])
+
+
+def _template(templates, prompt, role, difficulty):
+    if role not in ROLE_INFO:
+        role = DEFAULT_ROLE
+    template = templates.get((role, difficulty))
+    if template is None:
+        # Difficulty not in the catalog, compile it on demand
+        template = _compile(prompt, ROLE_INFO[role], difficulty)
+    return template
+
+
+def question_prompt(role, question_number, difficulty):
+    template = _template(QUESTION_TEMPLATES, QUESTION_PROMPT, role, difficulty)
+    return template.substitute(question_number=question_number)
+
+
+def grading_prompt(question, answer, role, difficulty):
+    template = _template(GRADING_TEMPLATES, GRADING_PROMPT, role, difficulty)
+    return template.substitute(question=question, answer=answer)
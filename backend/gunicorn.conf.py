@@ -0,0 +1,20 @@
+# Gunicorn settings: gunicorn -c gunicorn.conf.py "app:create_app()"
+import multiprocessing
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:5001")
+workers = int(os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+
+# Import and build the app once in the master, then fork workers from it
+preload_app = True
+
+
+def post_fork(server, worker):
+    # Forked workers must not share the master's DB connections or HTTP session
+    from extensions import db
+    from llm import reset_http_client
+
+    app = server.app.wsgi()
+    with app.app_context():
+        db.engine.dispose(close=False)
+    reset_http_client()
@@ -0,0 +1,179 @@
+"""Scheduled cleanup for the hot game tables.
+
+Marks stale in-progress sessions as abandoned and moves old anonymous sessions
+(and their questions, answers and evaluations) into a cold archive database.
+Work is committed in small batches so the write lock is never held for long.
+VACUUM/ANALYZE is opt-in because on SQLite VACUUM rewrites the whole file
+under an exclusive lock; run it off-peak. From cron:
+
+    flask --app app maintenance                # hourly
+    flask --app app maintenance --vacuum       # daily, off-peak
+"""
+import json
+import os
+import time
+from datetime import datetime, timedelta
+
+import click
+from flask import current_app
+from sqlalchemy import create_engine, delete, select, update
+
+from extensions import db
+from models import Answer, Evaluation, InterviewSession, Question
+
+
+def archive_database_uri():
+    uri = current_app.config.get('ARCHIVE_DATABASE_URI')
+    if uri:
+        return uri
+    # Flask-SQLAlchemy only creates the instance folder for relative SQLite URIs
+    os.makedirs(current_app.instance_path, exist_ok=True)
+    return 'sqlite:///' + os.path.join(current_app.instance_path, 'hr_pg_archive.db')
+
+
+def reap_stale_sessions(cutoff, now, batch_size=500):
+    """Mark sessions still in progress since before `cutoff` as abandoned."""
+    total = 0
+    while True:
+        ids = db.session.execute(
+            select(InterviewSession.id)
+            .where(
+                InterviewSession.status == 'in_progress',
+                InterviewSession.started_at < cutoff
+            )
+            .limit(batch_size)
+        ).scalars().all()
+        if not ids:
+            break
+
+        db.session.execute(
+            update(InterviewSession)
+            .where(InterviewSession.id.in_(ids))
+            .values(status='abandoned', ended_at=now)
+        )
+        db.session.commit()
+        total += len(ids)
+    return total
+
+
+def _copy_rows(archive_engine, table, rows):
+    if not rows:
+        return
+    ids = [row['id'] for row in rows]
+    with archive_engine.begin() as conn:
+        # Replace rows left behind by an interrupted earlier run
+        conn.execute(delete(table).where(table.c.id.in_(ids)))
+        conn.execute(table.insert(), [dict(row) for row in rows])
+
+
+def archive_anonymous_sessions(cutoff, batch_size=500, archive_engine=None):
+    """Move finished anonymous sessions started before `cutoff` out of the hot tables.
+
+    Rows are copied to `archive_engine` first when given, otherwise just deleted.
+    """
+    counts = {"sessions": 0, "questions": 0, "answers": 0, "evaluations": 0}
+    while True:
+        session_ids = db.session.execute(
+            select(InterviewSession.id)
+            .where(
+                InterviewSession.user_id.is_(None),
+                InterviewSession.status != 'in_progress',
+                InterviewSession.started_at < cutoff
+            )
+            .limit(batch_size)
+        ).scalars().all()
+        if not session_ids:
+            break
+
+        question_ids = db.session.execute(
+            select(Question.id).where(Question.session_id.in_(session_ids))
+        ).scalars().all()
+        answer_ids = db.session.execute(
+            select(Answer.id).where(Answer.question_id.in_(question_ids))
+        ).scalars().all()
+
+        # Parents first when copying, children first when deleting
+        batches = [
+            ("sessions", InterviewSession.__table__, InterviewSession.id.in_(session_ids)),
+            ("questions", Question.__table__, Question.id.in_(question_ids)),
+            ("answers", Answer.__table__, Answer.id.in_(answer_ids)),
+            ("evaluations", Evaluation.__table__, Evaluation.answer_id.in_(answer_ids)),
+        ]
+
+        if archive_engine is not None:
+            for _, table, condition in batches:
+                rows = db.session.execute(select(table).where(condition)).mappings().all()
+                _copy_rows(archive_engine, table, rows)
+
+        for name, table, condition in reversed(batches):
+            result = db.session.execute(delete(table).where(condition))
+            counts[name] += result.rowcount
+        db.session.commit()
+    return counts
+
+
+def compact_database():
+    """Reclaim space and refresh planner statistics on the hot database."""
+    # VACUUM can't run inside a transaction
+    with db.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.exec_driver_sql("VACUUM")
+        conn.exec_driver_sql("ANALYZE")
+
+
+def run_maintenance(stale_after=timedelta(hours=2), retention=timedelta(days=30),
+                    batch_size=500, archive=True, vacuum=False):
+    """Run every maintenance step and return a report of rows and seconds taken."""
+    now = datetime.utcnow()
+    timings = {}
+    started = time.perf_counter()
+
+    step = time.perf_counter()
+    abandoned = reap_stale_sessions(now - stale_after, now, batch_size)
+    timings["reap"] = time.perf_counter() - step
+
+    archive_engine = None
+    if archive:
+        archive_engine = create_engine(archive_database_uri())
+        db.metadata.create_all(archive_engine)
+
+    step = time.perf_counter()
+    try:
+        archived = archive_anonymous_sessions(now - retention, batch_size, archive_engine)
+    finally:
+        if archive_engine is not None:
+            archive_engine.dispose()
+    timings["archive"] = time.perf_counter() - step
+
+    if vacuum:
+        step = time.perf_counter()
+        compact_database()
+        timings["vacuum"] = time.perf_counter() - step
+
+    return {
+        "sessions_abandoned": abandoned,
+        "archived" if archive else "deleted": archived,
+        "timings_s": {name: round(seconds, 3) for name, seconds in timings.items()},
+        "total_s": round(time.perf_counter() - started, 3),
+    }
+
+
+@click.command('maintenance')
+@click.option('--stale-hours', default=2.0, show_default=True,
+              help='Mark in-progress sessions older than this as abandoned.')
+@click.option('--retention-days', default=30.0, show_default=True,
+              help='Archive anonymous sessions older than this.')
+@click.option('--batch-size', default=500, show_default=True,
+              help='Rows per transaction.')
+@click.option('--no-archive', is_flag=True, help='Delete old anonymous data instead of archiving it.')
+@click.option('--vacuum', is_flag=True,
+              help='Also run VACUUM/ANALYZE (locks the whole database on SQLite).')
+def maintenance_command(stale_hours, retention_days, batch_size, no_archive, vacuum):
+    """Reap abandoned sessions and archive old anonymous data."""
+    report = run_maintenance(
+        stale_after=timedelta(hours=stale_hours),
+        retention=timedelta(days=retention_days),
+        batch_size=batch_size,
+        archive=not no_archive,
+        vacuum=vacuum,
+    )
+    click.echo(json.dumps(report, indent=2))
@@ -19,6 +19,9 @@ class User(db.Model):
         return check_password_hash(self.password_hash, password)
 
 class InterviewSession(db.Model):
+    # Supports the history listing and the stale-session reaper
+    __table_args__ = (db.Index('ix_interview_session_status_started_at', 'status', 'started_at'),)
+
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=True)
     role = db.Column(db.String(50), nullable=False)
@@ -31,7 +34,7 @@ class InterviewSession(db.Model):
 
 class Question(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    session_id = db.Column(db.Integer, db.ForeignKey('interview_session.id'), nullable=False)
+    session_id = db.Column(db.Integer, db.ForeignKey('interview_session.id'), nullable=False, index=True)
     turn_index = db.Column(db.Integer, nullable=False)
     question_type = db.Column(db.String(50), nullable=True) # behavioral, technical, etc.
     prompt_text = db.Column(db.Text, nullable=False)
@@ -40,7 +43,7 @@ class Question(db.Model):
 
 class Answer(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    question_id = db.Column(db.Integer, db.ForeignKey('question.id'), nullable=False)
+    question_id = db.Column(db.Integer, db.ForeignKey('question.id'), nullable=False, index=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=True)
     answer_text = db.Column(db.Text, nullable=False)
     timestamp = db.Column(db.DateTime, default=datetime.utcnow)
@@ -49,7 +52,7 @@ class Answer(db.Model):
 
 class Evaluation(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    answer_id = db.Column(db.Integer, db.ForeignKey('answer.id'), nullable=False)
+    answer_id = db.Column(db.Integer, db.ForeignKey('answer.id'), nullable=False, index=True)
     impact_score = db.Column(db.Integer, nullable=False)
     feedback_text = db.Column(db.Text, nullable=False)
     rubric_scores_json = db.Column(db.Text, nullable=True)
@@ -0,0 +1,57 @@
+from flask import Blueprint, jsonify, request
+from flask_jwt_extended import create_access_token, get_jwt_identity, jwt_required
+from extensions import db
+from models import User
+
+auth_bp = Blueprint('auth', __name__, url_prefix='/api/auth')
+
+
+@auth_bp.route('/register', methods=['POST'])
+def register():
+    data = request.json
+    email = data.get('email')
+    password = data.get('password')
+    
+    if not email or not password:
+        return jsonify({"message": "Email and password are required"}), 400
+        
+    if User.query.filter_by(email=email).first():
+        return jsonify({"message": "Email already registered"}), 400
+        
+    new_user = User(email=email)
+    new_user.set_password(password)
+    
+    db.session.add(new_user)
+    db.session.commit()
+    
+    # Auto-login after registration
+    access_token = create_access_token(identity=str(new_user.id))
+    return jsonify({
+        "message": "User registered successfully",
+        "token": access_token, 
+        "user": {"id": new_user.id, "email": new_user.email}
+    }), 201
+
+@auth_bp.route('/login', methods=['POST'])
+def login():
+    data = request.json
+    email = data.get('email')
+    password = data.get('password')
+    
+    user = User.query.filter_by(email=email).first()
+    
+    if user and user.check_password(password):
+        access_token = create_access_token(identity=str(user.id))
+        return jsonify({"token": access_token, "user": {"id": user.id, "email": user.email}}), 200
+        
+    return jsonify({"message": "Invalid credentials"}), 401
+
+@auth_bp.route('/me', methods=['GET'])
+@jwt_required(optional=True)
+def get_current_user():
+    current_user_id = get_jwt_identity()
+    if current_user_id:
+        user = User.query.get(current_user_id)
+        if user:
+            return jsonify({"user": {"id": user.id, "email": user.email}}), 200
+    return jsonify({"user": None}), 200
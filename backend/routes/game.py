@@ -0,0 +1,187 @@
+from flask import Blueprint, Response, jsonify, request
+from flask_jwt_extended import get_jwt_identity, jwt_required
+from datetime import datetime
+from extensions import db
+from catalog import ROLES_ETAG, ROLES_PAYLOAD, get_role_info
+from llm import generate_question_with_ai, grade_answer_with_ai
+from models import InterviewSession, Question, Answer, Evaluation
+
+game_bp = Blueprint('game', __name__, url_prefix='/api')
+
+
+@game_bp.route('/roles', methods=['GET'])
+def get_roles():
+    # Payload is serialized once at startup; clients revalidate with the ETag
+    response = Response(ROLES_PAYLOAD, mimetype='application/json')
+    response.set_etag(ROLES_ETAG)
+    response.cache_control.public = True
+    response.cache_control.max_age = 3600
+    return response.make_conditional(request)
+
+
+@game_bp.route('/game/start', methods=['POST'])
+@jwt_required(optional=True)
+def start_game():
+    data = request.json
+    role = data.get('role', 'software_engineer')
+    
+    user_id = get_jwt_identity()
+    
+    # Create new session
+    role_info = get_role_info(role)
+    new_session = InterviewSession(
+        user_id=int(user_id) if user_id else None,
+        role=role,
+        difficulty=role_info['difficulty'],
+        status='in_progress'
+    )
+    
+    db.session.add(new_session)
+    db.session.commit()
+
+    # Default to 5 questions per game
+    total_questions = 5
+
+    return jsonify({
+        "sessionId": new_session.id,
+        "gameId": "game_" + role,
+        "role": role,
+        "totalQuestions": total_questions,
+        "bossHealth": 100,
+        "playerHealth": 100
+    })
+
+
+@game_bp.route('/game/question', methods=['POST'])
+def get_question():
+    data = request.json
+    role = data.get('role', 'software_engineer')
+    question_number = data.get('questionNumber', 0)
+    session_id = data.get('sessionId')
+
+    role_info = get_role_info(role)
+    difficulty = role_info["difficulty"]
+
+    # Try to generate a question with AI
+    ai_question = generate_question_with_ai(role, question_number + 1, difficulty)
+
+    if not ai_question:
+        return jsonify({
+            "error": True,
+            "message": "Unable to generate question. Please check your API configuration and try again."
+        }), 503
+        
+    # Save question to DB if session exists
+    if session_id:
+        question = Question(
+            session_id=session_id,
+            turn_index=question_number + 1,
+            question_type="behavioral", # Default for now
+            prompt_text=ai_question
+        )
+        db.session.add(question)
+        db.session.commit()
+        
+        # Return question ID so answer can be linked
+        return jsonify({
+            "questionId": question.id,
+            "questionNumber": question_number + 1,
+            "question": ai_question,
+            "totalQuestions": 5
+        })
+
+    return jsonify({
+        "questionNumber": question_number + 1,
+        "question": ai_question,
+        "totalQuestions": 5
+    })
+
+
+@game_bp.route('/game/answer', methods=['POST'])
+@jwt_required(optional=True)
+def submit_answer():
+    data = request.json
+    answer_text = data.get('answer', '')
+    question_text = data.get('question', '')
+    boss_health = data.get('bossHealth', 100)
+    player_health = data.get('playerHealth', 100)
+    role = data.get('role', 'software_engineer')
+    session_id = data.get('sessionId')
+    question_id = data.get('questionId')
+    question_number = data.get('questionNumber', 0)
+    total_questions = data.get('totalQuestions', 5)
+    
+    user_id = get_jwt_identity()
+
+    role_info = get_role_info(role)
+    difficulty = role_info["difficulty"]
+
+    # Try to grade with AI
+    score, ai_feedback = grade_answer_with_ai(question_text, answer_text, role, difficulty)
+
+    if score is None:
+        # AI grading failed - return error
+        return jsonify({
+            "error": True,
+            "message": "Unable to grade your answer. Please check your API configuration and try again."
+        }), 503
+
+    # AI grading successful - use score as damage to boss
+    damage = score
+    feedback = ai_feedback
+
+    # If score is very low, the boss counterattacks
+    if score < 30:
+        player_damage = 30 - score  # Lower score = more player damage
+        player_health -= player_damage
+        feedback = f"{feedback} The boss counters for {player_damage} damage!"
+
+    boss_health = max(0, boss_health - damage)
+    player_health = max(0, player_health)
+    
+    # Save answer and evaluation to DB
+    if question_id:
+        answer_entry = Answer(
+            question_id=question_id,
+            user_id=int(user_id) if user_id else None,
+            answer_text=answer_text
+        )
+        db.session.add(answer_entry)
+        db.session.commit()
+        
+        evaluation = Evaluation(
+            answer_id=answer_entry.id,
+            impact_score=score,
+            feedback_text=feedback
+        )
+        db.session.add(evaluation)
+        
+        # Update session status if game over
+        if session_id:
+            session = InterviewSession.query.get(session_id)
+            if session:
+                # Check if this was the last question
+                is_last_question = question_number >= total_questions
+                
+                if boss_health <= 0:
+                    session.status = 'completed_won'
+                    session.ended_at = datetime.utcnow()
+                elif player_health <= 0:
+                    session.status = 'completed_lost'
+                    session.ended_at = datetime.utcnow()
+                elif is_last_question:
+                    # Game finished all questions, determine winner by health
+                    if boss_health < player_health:
+                        session.status = 'completed_won'
+                    else:
+                        session.status = 'completed_lost'
+                    session.ended_at = datetime.utcnow()
+        
+        db.session.commit()
+
+    return jsonify({
+        "damage": damage,
+        "bossHealth": boss_health,
+        "playerHealth": player_health,
+        "feedback": feedback
+    })